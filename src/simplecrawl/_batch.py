@@ -0,0 +1,42 @@
+"""Helpers for chaining dependent client calls with `batch`."""
+
+import re
+from typing import Any, Dict, List
+
+# Batch operation names mapped to the client method that implements them.
+BATCH_OPERATIONS = {
+    "scrape": "scrape",
+    "crawl": "crawl",
+    "status": "get_crawl_status",
+    "cancel": "cancel_crawl",
+    "map": "map",
+}
+
+# "$K.field" or "$K.field.subfield" refers to an attribute of call K's result.
+_REFERENCE = re.compile(r"^\$(\d+)\.(\w+(?:\.\w+)*)$")
+
+
+def resolve_method(operation: str) -> str:
+    """Return the client method name for a batch operation."""
+    try:
+        return BATCH_OPERATIONS[operation]
+    except KeyError:
+        raise ValueError(f"Unknown batch operation: {operation!r}") from None
+
+
+def resolve_references(args: Dict[str, Any], results: List[Any]) -> Dict[str, Any]:
+    """Replace "$K.field" string values in `args` with fields of earlier results."""
+    resolved: Dict[str, Any] = {}
+    for key, value in args.items():
+        match = _REFERENCE.match(value) if isinstance(value, str) else None
+        if match is not None:
+            index = int(match.group(1))
+            if index >= len(results):
+                raise ValueError(
+                    f"Batch reference {value!r} does not point at an earlier call."
+                )
+            value = results[index]
+            for attr in match.group(2).split("."):
+                value = getattr(value, attr)
+        resolved[key] = value
+    return resolved
@@ -0,0 +1,74 @@
+"""Request payload builders shared by the sync and async clients."""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+import msgspec
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared, immutable default for the "formats" option; encodes as ["markdown"].
+DEFAULT_FORMATS: Tuple[str, ...] = ("markdown",)
+
+# Statuses meaning the server does not accept a "urls" list on /scrape.
+BATCH_UNSUPPORTED_STATUSES = frozenset({400, 404, 422})
+
+# Seconds to wait for a /scrape response beyond the server-side scrape time.
+SCRAPE_TIMEOUT_MARGIN = 10.0
+
+_JSON_ENCODER = msgspec.json.Encoder()
+
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes."""
+    return _JSON_ENCODER.encode(payload)
+
+
+def scrape_request_timeout(
+    timeout: int = 30000, wait_for: int = 0, count: int = 1
+) -> httpx.Timeout:
+    """Client-side timeout for a /scrape request.
+
+    The read timeout covers the server's `wait_for` and `timeout` (milliseconds)
+    for each of `count` URLs, plus SCRAPE_TIMEOUT_MARGIN seconds.
+    """
+    read = count * (timeout + wait_for) / 1000 + SCRAPE_TIMEOUT_MARGIN
+    return httpx.Timeout(30.0, read=read)
+
+
+def build_scrape_payload(
+    url: Union[str, List[str]],
+    formats: Optional[List[str]] = None,
+    include_tags: Optional[List[str]] = None,
+    exclude_tags: Optional[List[str]] = None,
+    headers: Optional[Dict[str, Any]] = None,
+    wait_for: int = 0,
+    timeout: int = 30000,
+    extract_schema: Optional[Dict[str, Any]] = None,
+    extract_system_prompt: Optional[str] = None,
+    extract_prompt: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build a /scrape payload.
+
+    A single URL is sent as "url"; a list of URLs as "urls" for batch scrapes.
+    """
+    target = "url" if isinstance(url, str) else "urls"
+    payload: Dict[str, Any] = {
+        target: url,
+        "formats": formats or DEFAULT_FORMATS,
+        "waitFor": wait_for,
+        "timeout": timeout,
+    }
+    if include_tags is not None:
+        payload["includeTags"] = include_tags
+    if exclude_tags is not None:
+        payload["excludeTags"] = exclude_tags
+    if headers is not None:
+        payload["headers"] = headers
+    if extract_schema or extract_system_prompt or extract_prompt:
+        payload["extract"] = {
+            "schema": extract_schema,
+            "systemPrompt": extract_system_prompt,
+            "prompt": extract_prompt,
+        }
+    return payload
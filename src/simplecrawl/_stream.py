@@ -0,0 +1,26 @@
+"""Incremental parser for streamed /crawl/{id} response bodies."""
+
+from typing import Any, Dict, List
+
+import ijson  # type: ignore[import-untyped]
+
+from .models import ScrapeResult
+
+
+class CrawlResultStream:
+    """Incrementally parse the `data` items of a /crawl/{id} response body."""
+
+    def __init__(self) -> None:
+        self._items: List[Dict[str, Any]] = ijson.sendable_list()
+        self._parser = ijson.items_coro(self._items, "data.item", use_float=True)
+
+    def feed(self, chunk: bytes) -> List[ScrapeResult]:
+        """Parse a chunk of the body and return the results it completed."""
+        self._parser.send(chunk)
+        results = [ScrapeResult.model_validate(item) for item in self._items]
+        del self._items[:]
+        return results
+
+    def close(self) -> None:
+        """Finish parsing, raising if the body was truncated."""
+        self._parser.close()
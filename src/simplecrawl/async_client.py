@@ -1,12 +1,29 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 
+from ._batch import resolve_method, resolve_references
+from ._cache import TTLCache
+from ._payloads import (
+    BATCH_UNSUPPORTED_STATUSES,
+    DEFAULT_FORMATS,
+    JSON_HEADERS,
+    build_scrape_payload,
+    encode_payload,
+    scrape_request_timeout,
+)
+from ._stream import CrawlResultStream
 from .models import (
     CrawlJob,
+    CrawlState,
     CrawlStatus,
     MapResult,
     ScrapeResult,
+    _CancelResponse,
+    _ScrapeBatchEnvelope,
+    _ScrapeEnvelope,
 )
 
 
@@ -22,17 +39,47 @@ class AsyncFirecrawlClient:
             print(scrape_result.markdown)
     """
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        client: Optional[httpx.AsyncClient] = None,
+        status_cache_ttl: float = 0.5,
+        map_cache_ttl: float = 60.0,
+    ) -> None:
         """
         Initialize the AsyncFirecrawlClient.
 
         Args:
             base_url: The base URL for the API, e.g. "https://api.firecrawl.dev/v1"
+            client: Optional shared httpx.AsyncClient. It is not closed by this
+                client.
+            status_cache_ttl: Seconds to reuse a crawl status response for the
+                same job. 0 disables caching.
+            map_cache_ttl: Seconds to reuse a map response for identical
+                arguments. 0 disables caching.
         """
         if not base_url:
             raise ValueError("Base URL must be provided.")
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient()
+        # Endpoint URLs are parsed once here rather than on every request.
+        self._scrape_url = httpx.URL(f"{self.base_url}/scrape")
+        self._crawl_url = httpx.URL(f"{self.base_url}/crawl")
+        self._crawl_url_prefix = f"{self.base_url}/crawl/"
+        self._map_url = httpx.URL(f"{self.base_url}/map")
+        self._status_cache = TTLCache(maxsize=128, ttl=status_cache_ttl)
+        self._map_cache = TTLCache(maxsize=256, ttl=map_cache_ttl)
+        # Whether the server accepts a "urls" list on /scrape; None until tried.
+        self._batch_scrape_supported: Optional[bool] = None
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(30.0),
+        )
 
     async def scrape(
         self,
@@ -50,29 +97,97 @@ class AsyncFirecrawlClient:
         """
         Asynchronously scrape a single URL for content and metadata.
         """
-        payload: Dict[str, Any] = {
-            "url": url,
-            "formats": formats or ["markdown"],
-            "waitFor": wait_for,
-            "timeout": timeout,
-        }
-        if include_tags is not None:
-            payload["includeTags"] = include_tags
-        if exclude_tags is not None:
-            payload["excludeTags"] = exclude_tags
-        if headers is not None:
-            payload["headers"] = headers
-        if extract_schema or extract_system_prompt or extract_prompt:
-            payload["extract"] = {
-                "schema": extract_schema,
-                "systemPrompt": extract_system_prompt,
-                "prompt": extract_prompt,
-            }
-
-        resp = await self.client.post(f"{self.base_url}/scrape", json=payload)
+        payload = build_scrape_payload(
+            url,
+            formats,
+            include_tags,
+            exclude_tags,
+            headers,
+            wait_for,
+            timeout,
+            extract_schema,
+            extract_system_prompt,
+            extract_prompt,
+        )
+
+        resp = await self.client.post(
+            self._scrape_url,
+            content=encode_payload(payload),
+            headers=JSON_HEADERS,
+            timeout=scrape_request_timeout(timeout, wait_for),
+        )
         resp.raise_for_status()
-        data = resp.json()
-        return ScrapeResult.model_validate(data["data"])
+        return _ScrapeEnvelope.model_validate_json(resp.content).data
+
+    async def scrape_many(
+        self, urls: List[str], *, concurrency: int = 16, **scrape_kwargs: Any
+    ) -> List[ScrapeResult]:
+        """
+        Scrape several URLs concurrently, with at most `concurrency` in flight.
+
+        Extra keyword arguments are passed to `scrape`. Results are returned in
+        the same order as `urls`.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1.")
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(url: str) -> ScrapeResult:
+            async with sem:
+                return await self.scrape(url, **scrape_kwargs)
+
+        return await asyncio.gather(*[_one(u) for u in urls])
+
+    async def scrape_batch(
+        self,
+        urls: List[str],
+        *,
+        concurrency: int = 16,
+        **scrape_kwargs: Any,
+    ) -> List[ScrapeResult]:
+        """
+        Scrape several URLs in one request when the server supports batching.
+
+        Falls back to `scrape_many` if the server rejects a "urls" list with 400,
+        404 or 422 and a single-URL scrape with the same options succeeds; other
+        errors are raised.
+        """
+        if not urls:
+            return []
+        if self._batch_scrape_supported is not False:
+            payload = build_scrape_payload(urls, **scrape_kwargs)
+            resp = await self.client.post(
+                self._scrape_url,
+                content=encode_payload(payload),
+                headers=JSON_HEADERS,
+                timeout=scrape_request_timeout(
+                    scrape_kwargs.get("timeout", 30000),
+                    scrape_kwargs.get("wait_for", 0),
+                    count=len(urls),
+                ),
+            )
+            if (
+                self._batch_scrape_supported is None
+                and resp.status_code in BATCH_UNSUPPORTED_STATUSES
+            ):
+                # The same status can mean bad options, so only a single-URL
+                # scrape that succeeds shows the "urls" list was the problem.
+                first = await self.scrape(urls[0], **scrape_kwargs)
+                self._batch_scrape_supported = False
+                rest = await self.scrape_many(
+                    urls[1:], concurrency=concurrency, **scrape_kwargs
+                )
+                return [first, *rest]
+            resp.raise_for_status()
+            results = _ScrapeBatchEnvelope.model_validate_json(resp.content).data
+            if len(results) != len(urls):
+                raise ValueError(
+                    f"Batch scrape returned {len(results)} results for "
+                    f"{len(urls)} URLs."
+                )
+            self._batch_scrape_supported = True
+            return results
+        return await self.scrape_many(urls, concurrency=concurrency, **scrape_kwargs)
 
     async def crawl(
         self,
@@ -102,7 +217,7 @@ class AsyncFirecrawlClient:
             "allowBackwardLinks": allow_backward_links,
             "allowExternalLinks": allow_external_links,
             "scrapeOptions": {
-                "formats": scrape_formats or ["markdown"],
+                "formats": scrape_formats or DEFAULT_FORMATS,
                 "waitFor": scrape_wait_for,
             },
         }
@@ -120,28 +235,79 @@ class AsyncFirecrawlClient:
         if scrape_exclude_tags is not None:
             payload["scrapeOptions"]["excludeTags"] = scrape_exclude_tags
 
-        resp = await self.client.post(f"{self.base_url}/crawl", json=payload)
+        resp = await self.client.post(
+            self._crawl_url,
+            content=encode_payload(payload),
+            headers=JSON_HEADERS,
+        )
         resp.raise_for_status()
-        data = resp.json()
-        return CrawlJob.model_validate(data)
+        return CrawlJob.model_validate_json(resp.content)
+
+    async def crawl_and_wait(
+        self,
+        url: str,
+        poll_interval: float = 1.0,
+        max_wait: Optional[float] = None,
+        **crawl_kwargs: Any,
+    ) -> CrawlStatus:
+        """
+        Start a crawl job and poll its status until it is no longer scraping.
+        """
+        job = await self.crawl(url, **crawl_kwargs)
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            # Poll uncached so intervals shorter than the cache TTL see updates.
+            status = await self._fetch_crawl_status(job.id)
+            if status.status != CrawlState.SCRAPING:
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Crawl job {job.id} did not finish within {max_wait} seconds."
+                )
+            await asyncio.sleep(poll_interval)
 
     async def get_crawl_status(self, job_id: str) -> CrawlStatus:
         """
         Retrieve the status of a crawl job.
+
+        Responses are cached for `status_cache_ttl` seconds; cached models are
+        shared, mutable instances.
         """
-        resp = await self.client.get(f"{self.base_url}/crawl/{job_id}")
+        cached = self._status_cache.get(job_id)
+        if cached is not None:
+            return cached
+
+        status = await self._fetch_crawl_status(job_id)
+        self._status_cache.set(job_id, status)
+        return status
+
+    async def _fetch_crawl_status(self, job_id: str) -> CrawlStatus:
+        """Request a crawl job's status, bypassing the status cache."""
+        resp = await self.client.get(f"{self._crawl_url_prefix}{job_id}")
         resp.raise_for_status()
-        data = resp.json()
-        return CrawlStatus.model_validate(data)
+        return CrawlStatus.model_validate_json(resp.content)
+
+    async def iter_crawl_results(self, job_id: str) -> AsyncIterator[ScrapeResult]:
+        """
+        Stream the results of a crawl job as they are parsed from the response.
+        """
+        stream = CrawlResultStream()
+        url = f"{self._crawl_url_prefix}{job_id}"
+        async with self.client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes():
+                for result in stream.feed(chunk):
+                    yield result
+        stream.close()
 
     async def cancel_crawl(self, job_id: str) -> bool:
         """
         Cancel a running crawl job.
         """
-        resp = await self.client.delete(f"{self.base_url}/crawl/{job_id}")
+        self._status_cache.discard(job_id)
+        resp = await self.client.delete(f"{self._crawl_url_prefix}{job_id}")
         resp.raise_for_status()
-        data = resp.json()
-        return data.get("success", False)
+        return _CancelResponse.model_validate_json(resp.content).success
 
     async def map(
         self,
@@ -153,7 +319,15 @@ class AsyncFirecrawlClient:
     ) -> MapResult:
         """
         Asynchronously map URLs from a given website.
+
+        Responses are cached for `map_cache_ttl` seconds; cached models are
+        shared, mutable instances.
         """
+        key = (url, search, ignore_sitemap, include_subdomains, limit)
+        cached = self._map_cache.get(key)
+        if cached is not None:
+            return cached
+
         payload: Dict[str, Any] = {
             "url": url,
             "ignoreSitemap": ignore_sitemap,
@@ -164,14 +338,30 @@ class AsyncFirecrawlClient:
         if search is not None:
             payload["search"] = search
 
-        resp = await self.client.post(f"{self.base_url}/map", json=payload)
+        resp = await self.client.post(
+            self._map_url,
+            content=encode_payload(payload),
+            headers=JSON_HEADERS,
+        )
         resp.raise_for_status()
-        data = resp.json()
-        return MapResult.model_validate(data)
+        result = MapResult.model_validate_json(resp.content)
+        self._map_cache.set(key, result)
+        return result
+
+    async def batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Run dependent calls in order, e.g. start a crawl and fetch its status.
+        """
+        results: List[Any] = []
+        for operation, args in calls:
+            method = getattr(self, resolve_method(operation))
+            results.append(await method(**resolve_references(args, results)))
+        return results
 
     async def close(self) -> None:
-        """Close the underlying httpx client."""
-        await self.client.aclose()
+        """Close the underlying httpx client if this instance created it."""
+        if self._owns_client:
+            await self.client.aclose()
 
     async def __aenter__(self):
         """Enter async context."""
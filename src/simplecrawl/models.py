@@ -1,8 +1,14 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+from pydantic.main import BaseModel
+from pydantic.networks import HttpUrl
+from pydantic.type_adapter import TypeAdapter
+
+_HTTP_URL_ADAPTER: TypeAdapter[HttpUrl] = TypeAdapter(HttpUrl)
 
 
 class OutputFormat(str, Enum):
@@ -30,12 +36,17 @@ class Metadata(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     language: Optional[str] = None
-    sourceURL: HttpUrl
+    sourceURL: str
     statusCode: int
     error: Optional[str] = None
 
     model_config = ConfigDict(extra="allow")
 
+    @property
+    def sourceURL_parsed(self) -> HttpUrl:
+        """sourceURL validated as an HttpUrl."""
+        return _HTTP_URL_ADAPTER.validate_python(self.sourceURL)
+
 
 class ScrapeResult(BaseModel):
     """Content and metadata from a scraped page."""
@@ -46,7 +57,8 @@ class ScrapeResult(BaseModel):
     links: Optional[List[str]] = None
     metadata: Metadata
     # llm_extraction and warning are not fully typed as they are optional, dynamic fields.
-    llm_extraction: Optional[Dict[str, Any]] = Field(None, alias="llm_extraction")
+    # llm_extraction is passed through as decoded, without validation.
+    llm_extraction: Any = Field(None, alias="llm_extraction")
     warning: Optional[str] = None
 
 
@@ -56,17 +68,27 @@ class CrawlStatus(BaseModel):
     status: CrawlState
     total: int
     completed: int
-    expires_at: datetime = Field(..., alias="expiresAt")
+    expires_at: str = Field(..., alias="expiresAt")
     next: Optional[str] = None
     data: List[ScrapeResult]
 
+    @property
+    def expires_at_parsed(self) -> datetime:
+        """expires_at parsed as a datetime."""
+        return datetime.fromisoformat(self.expires_at)
+
 
 class CrawlJob(BaseModel):
     """Reference to a created crawl job."""
 
     success: bool
     id: str
-    url: HttpUrl
+    url: str
+
+    @property
+    def url_parsed(self) -> HttpUrl:
+        """url validated as an HttpUrl."""
+        return _HTTP_URL_ADAPTER.validate_python(self.url)
 
 
 class MapResult(BaseModel):
@@ -74,3 +96,21 @@ class MapResult(BaseModel):
 
     success: bool
     links: List[str]
+
+
+class _ScrapeEnvelope(BaseModel):
+    """Wrapper around the /scrape response payload."""
+
+    data: ScrapeResult
+
+
+class _ScrapeBatchEnvelope(BaseModel):
+    """Wrapper around a batch /scrape response payload."""
+
+    data: List[ScrapeResult]
+
+
+class _CancelResponse(BaseModel):
+    """Response body of a crawl cancellation."""
+
+    success: bool = False
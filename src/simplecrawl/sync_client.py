@@ -1,12 +1,29 @@
-from typing import Any, Dict, List, Optional
-
-import requests
-
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from ._batch import resolve_method, resolve_references
+from ._cache import TTLCache
+from ._payloads import (
+    BATCH_UNSUPPORTED_STATUSES,
+    DEFAULT_FORMATS,
+    JSON_HEADERS,
+    build_scrape_payload,
+    encode_payload,
+    scrape_request_timeout,
+)
+from ._stream import CrawlResultStream
 from .models import (
     CrawlJob,
+    CrawlState,
     CrawlStatus,
     MapResult,
     ScrapeResult,
+    _CancelResponse,
+    _ScrapeBatchEnvelope,
+    _ScrapeEnvelope,
 )
 
 
@@ -41,19 +58,48 @@ class FirecrawlClient:
         # Map URLs
         map_result = client.map("https://example.com")
         print("Found links:", map_result.links)
+
+    The client is thread-safe. Share one instance across worker threads, e.g.
+    `ThreadPoolExecutor(max_workers=16).map(client.scrape, urls)`, so they reuse
+    its connection pool instead of each opening their own connections.
     """
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        prefer_http2: bool = True,
+        status_cache_ttl: float = 0.5,
+        map_cache_ttl: float = 60.0,
+    ) -> None:
         """
         Initialize the FirecrawlClient.
 
         Args:
             base_url: The base URL for the API, e.g. "https://api.firecrawl.dev/v1"
+            prefer_http2: Negotiate HTTP/2 when the server supports it. Disable to
+                force HTTP/1.1 on networks that break HTTP/2.
+            status_cache_ttl: Seconds to reuse a crawl status response for the
+                same job. 0 disables caching.
+            map_cache_ttl: Seconds to reuse a map response for identical
+                arguments. 0 disables caching.
         """
         if not base_url:
             raise ValueError("Base URL must be provided.")
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
+        # Endpoint URLs are parsed once here rather than on every request.
+        self._scrape_url = httpx.URL(f"{self.base_url}/scrape")
+        self._crawl_url = httpx.URL(f"{self.base_url}/crawl")
+        self._crawl_url_prefix = f"{self.base_url}/crawl/"
+        self._map_url = httpx.URL(f"{self.base_url}/map")
+        self._status_cache = TTLCache(maxsize=128, ttl=status_cache_ttl)
+        self._map_cache = TTLCache(maxsize=256, ttl=map_cache_ttl)
+        # Whether the server accepts a "urls" list on /scrape; None until tried.
+        self._batch_scrape_supported: Optional[bool] = None
+        self.session = httpx.Client(
+            http2=prefer_http2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(30.0),
+        )
 
     def scrape(
         self,
@@ -86,30 +132,113 @@ class FirecrawlClient:
         Returns:
             A ScrapeResult model containing scraped content and metadata.
         """
-        payload: Dict[str, Any] = {
-            "url": url,
-            "formats": formats or ["markdown"],
-            "waitFor": wait_for,
-            "timeout": timeout,
-        }
-        if include_tags is not None:
-            payload["includeTags"] = include_tags
-        if exclude_tags is not None:
-            payload["excludeTags"] = exclude_tags
-        if headers is not None:
-            payload["headers"] = headers
-
-        if extract_schema or extract_system_prompt or extract_prompt:
-            payload["extract"] = {
-                "schema": extract_schema,
-                "systemPrompt": extract_system_prompt,
-                "prompt": extract_prompt,
-            }
-
-        resp = self.session.post(f"{self.base_url}/scrape", json=payload)
+        payload = build_scrape_payload(
+            url,
+            formats,
+            include_tags,
+            exclude_tags,
+            headers,
+            wait_for,
+            timeout,
+            extract_schema,
+            extract_system_prompt,
+            extract_prompt,
+        )
+
+        resp = self.session.post(
+            self._scrape_url,
+            content=encode_payload(payload),
+            headers=JSON_HEADERS,
+            timeout=scrape_request_timeout(timeout, wait_for),
+        )
         resp.raise_for_status()
-        data = resp.json()
-        return ScrapeResult.model_validate(data["data"])
+        return _ScrapeEnvelope.model_validate_json(resp.content).data
+
+    def scrape_many(
+        self, urls: List[str], *, concurrency: int = 16, **scrape_kwargs: Any
+    ) -> List[ScrapeResult]:
+        """
+        Scrape several URLs in parallel worker threads.
+
+        The threads share this client's connection pool.
+
+        Args:
+            urls: URLs to scrape.
+            concurrency: Maximum number of requests in flight.
+            **scrape_kwargs: Additional arguments passed to `scrape`.
+
+        Returns:
+            A ScrapeResult for each URL, in order.
+
+        Raises:
+            ValueError: If `concurrency` is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1.")
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(lambda u: self.scrape(u, **scrape_kwargs), urls))
+
+    def scrape_batch(
+        self,
+        urls: List[str],
+        *,
+        concurrency: int = 16,
+        **scrape_kwargs: Any,
+    ) -> List[ScrapeResult]:
+        """
+        Scrape several URLs in one request when the server supports batching.
+
+        The URLs are sent as a "urls" list to /scrape. If the first batch is
+        rejected with 400, 404 or 422, the first URL is scraped on its own; if
+        that succeeds, the client remembers that batching is unsupported and
+        uses `scrape_many` for this and all later batches. Other errors, and a
+        failing single scrape, are raised.
+
+        Args:
+            urls: URLs to scrape.
+            concurrency: Maximum parallel requests when falling back to
+                `scrape_many`.
+            **scrape_kwargs: Scrape options, as accepted by `scrape`.
+
+        Returns:
+            A ScrapeResult for each URL, in order.
+        """
+        if not urls:
+            return []
+        if self._batch_scrape_supported is not False:
+            payload = build_scrape_payload(urls, **scrape_kwargs)
+            resp = self.session.post(
+                self._scrape_url,
+                content=encode_payload(payload),
+                headers=JSON_HEADERS,
+                timeout=scrape_request_timeout(
+                    scrape_kwargs.get("timeout", 30000),
+                    scrape_kwargs.get("wait_for", 0),
+                    count=len(urls),
+                ),
+            )
+            if (
+                self._batch_scrape_supported is None
+                and resp.status_code in BATCH_UNSUPPORTED_STATUSES
+            ):
+                # The same status can mean bad options, so only a single-URL
+                # scrape that succeeds shows the "urls" list was the problem.
+                first = self.scrape(urls[0], **scrape_kwargs)
+                self._batch_scrape_supported = False
+                rest = self.scrape_many(
+                    urls[1:], concurrency=concurrency, **scrape_kwargs
+                )
+                return [first, *rest]
+            resp.raise_for_status()
+            results = _ScrapeBatchEnvelope.model_validate_json(resp.content).data
+            if len(results) != len(urls):
+                raise ValueError(
+                    f"Batch scrape returned {len(results)} results for "
+                    f"{len(urls)} URLs."
+                )
+            self._batch_scrape_supported = True
+            return results
+        return self.scrape_many(urls, concurrency=concurrency, **scrape_kwargs)
 
     def crawl(
         self,
@@ -158,7 +287,7 @@ class FirecrawlClient:
             "allowBackwardLinks": allow_backward_links,
             "allowExternalLinks": allow_external_links,
             "scrapeOptions": {
-                "formats": scrape_formats or ["markdown"],
+                "formats": scrape_formats or DEFAULT_FORMATS,
                 "waitFor": scrape_wait_for,
             },
         }
@@ -176,25 +305,98 @@ class FirecrawlClient:
         if scrape_exclude_tags is not None:
             payload["scrapeOptions"]["excludeTags"] = scrape_exclude_tags
 
-        resp = self.session.post(f"{self.base_url}/crawl", json=payload)
+        resp = self.session.post(
+            self._crawl_url,
+            content=encode_payload(payload),
+            headers=JSON_HEADERS,
+        )
         resp.raise_for_status()
-        data = resp.json()
-        return CrawlJob.model_validate(data)
+        return CrawlJob.model_validate_json(resp.content)
+
+    def crawl_and_wait(
+        self,
+        url: str,
+        poll_interval: float = 1.0,
+        max_wait: Optional[float] = None,
+        **crawl_kwargs: Any,
+    ) -> CrawlStatus:
+        """
+        Start a crawl job and poll its status until it is no longer scraping.
+
+        Args:
+            url: Starting URL.
+            poll_interval: Seconds to wait between status checks.
+            max_wait: Give up after this many seconds. Waits indefinitely if None.
+            **crawl_kwargs: Additional arguments passed to `crawl`.
+
+        Returns:
+            The final CrawlStatus of the job.
+
+        Raises:
+            TimeoutError: If the job is still scraping after `max_wait` seconds.
+        """
+        job = self.crawl(url, **crawl_kwargs)
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            # Poll uncached so intervals shorter than the cache TTL see updates.
+            status = self._fetch_crawl_status(job.id)
+            if status.status != CrawlState.SCRAPING:
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Crawl job {job.id} did not finish within {max_wait} seconds."
+                )
+            time.sleep(poll_interval)
 
     def get_crawl_status(self, job_id: str) -> CrawlStatus:
         """
         Retrieve the status of a crawl job.
 
+        Responses are cached for `status_cache_ttl` seconds; cached models are
+        shared, mutable instances.
+
         Args:
             job_id: The crawl job ID.
 
         Returns:
             A CrawlStatus model with current job status and data.
         """
-        resp = self.session.get(f"{self.base_url}/crawl/{job_id}")
+        cached = self._status_cache.get(job_id)
+        if cached is not None:
+            return cached
+
+        status = self._fetch_crawl_status(job_id)
+        self._status_cache.set(job_id, status)
+        return status
+
+    def _fetch_crawl_status(self, job_id: str) -> CrawlStatus:
+        """Request a crawl job's status, bypassing the status cache."""
+        resp = self.session.get(f"{self._crawl_url_prefix}{job_id}")
         resp.raise_for_status()
-        data = resp.json()
-        return CrawlStatus.model_validate(data)
+        return CrawlStatus.model_validate_json(resp.content)
+
+    def iter_crawl_results(self, job_id: str) -> Iterator[ScrapeResult]:
+        """
+        Stream the results of a crawl job as they are parsed from the response.
+
+        Unlike `get_crawl_status`, the body is never held in memory in full, and
+        each result can be consumed before the rest of the response arrives.
+        Only the results in this status response are yielded; `next` pages are
+        not followed.
+
+        Args:
+            job_id: The crawl job ID.
+
+        Returns:
+            An iterator of ScrapeResult models.
+        """
+        stream = CrawlResultStream()
+        url = f"{self._crawl_url_prefix}{job_id}"
+        with self.session.stream("GET", url) as resp:
+            resp.raise_for_status()
+            for chunk in resp.iter_bytes():
+                yield from stream.feed(chunk)
+        stream.close()
 
     def cancel_crawl(self, job_id: str) -> bool:
         """
@@ -206,10 +408,10 @@ class FirecrawlClient:
         Returns:
             True if successfully cancelled, False otherwise.
         """
-        resp = self.session.delete(f"{self.base_url}/crawl/{job_id}")
+        self._status_cache.discard(job_id)
+        resp = self.session.delete(f"{self._crawl_url_prefix}{job_id}")
         resp.raise_for_status()
-        data = resp.json()
-        return data.get("success", False)
+        return _CancelResponse.model_validate_json(resp.content).success
 
     def map(
         self,
@@ -222,6 +424,9 @@ class FirecrawlClient:
         """
         Map (discover) URLs from a given website.
 
+        Responses are cached for `map_cache_ttl` seconds; cached models are
+        shared, mutable instances.
+
         Args:
             url: The base URL to start from.
             search: Optional search query to filter results.
@@ -232,6 +437,11 @@ class FirecrawlClient:
         Returns:
             A MapResult model with discovered links.
         """
+        key = (url, search, ignore_sitemap, include_subdomains, limit)
+        cached = self._map_cache.get(key)
+        if cached is not None:
+            return cached
+
         payload: Dict[str, Any] = {
             "url": url,
             "ignoreSitemap": ignore_sitemap,
@@ -242,7 +452,52 @@ class FirecrawlClient:
         if search is not None:
             payload["search"] = search
 
-        resp = self.session.post(f"{self.base_url}/map", json=payload)
+        resp = self.session.post(
+            self._map_url,
+            content=encode_payload(payload),
+            headers=JSON_HEADERS,
+        )
         resp.raise_for_status()
-        data = resp.json()
-        return MapResult.model_validate(data)
+        result = MapResult.model_validate_json(resp.content)
+        self._map_cache.set(key, result)
+        return result
+
+    def batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Run dependent calls in order, e.g. start a crawl and fetch its status.
+
+        Each call is an (operation, kwargs) pair, where operation is one of
+        "scrape", "crawl", "status", "cancel" or "map". A string value of the
+        form "$K.field" is replaced with that field of call K's result:
+
+            client.batch([
+                ("crawl", {"url": "https://example.com"}),
+                ("status", {"job_id": "$0.id"}),
+            ])
+
+        The firecrawl-simple API has no composite endpoint, so calls are issued
+        sequentially over the client's pooled connection.
+
+        Args:
+            calls: The operations to run.
+
+        Returns:
+            The result of each call, in order.
+        """
+        results: List[Any] = []
+        for operation, args in calls:
+            method = getattr(self, resolve_method(operation))
+            results.append(method(**resolve_references(args, results)))
+        return results
+
+    def close(self) -> None:
+        """Close the underlying httpx client."""
+        self.session.close()
+
+    def __enter__(self):
+        """Enter context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context."""
+        self.close()
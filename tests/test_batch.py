@@ -0,0 +1,64 @@
+import httpx
+import pytest
+import respx
+
+from simplecrawl import FirecrawlClient
+from simplecrawl._batch import resolve_references
+
+BASE = "http://fc.test/v1"
+JOB = {"success": True, "id": "abc", "url": "https://a.test/"}
+
+
+def test_resolve_references_walks_dotted_fields():
+    job = httpx.URL("https://a.test/path")
+
+    resolved = resolve_references({"host": "$0.host", "n": 3}, [job])
+
+    assert resolved == {"host": "a.test", "n": 3}
+
+
+@pytest.mark.parametrize("value", ["$abc", "$0", "costs $0.50!", "a $0.id"])
+def test_resolve_references_leaves_other_strings(value):
+    assert resolve_references({"v": value}, [object()]) == {"v": value}
+
+
+@pytest.mark.parametrize("reference", ["$1.id", "$7.id"])
+def test_resolve_references_rejects_later_calls(reference):
+    with pytest.raises(ValueError, match="does not point at an earlier call"):
+        resolve_references({"job_id": reference}, [object()])
+
+
+@respx.mock
+def test_batch_chains_results():
+    respx.post(f"{BASE}/crawl").mock(return_value=httpx.Response(200, json=JOB))
+    respx.delete(f"{BASE}/crawl/abc").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+    client = FirecrawlClient(BASE)
+
+    job, cancelled = client.batch(
+        [("crawl", {"url": "https://a.test/"}), ("cancel", {"job_id": "$0.id"})]
+    )
+
+    assert job.id == "abc"
+    assert cancelled is True
+
+
+@respx.mock
+def test_batch_rejects_bad_reference_before_sending():
+    client = FirecrawlClient(BASE)
+
+    with pytest.raises(ValueError, match="earlier call"):
+        client.batch([("status", {"job_id": "$0.id"})])
+
+    assert not respx.calls
+
+
+@respx.mock
+def test_batch_rejects_unknown_operation():
+    client = FirecrawlClient(BASE)
+
+    with pytest.raises(ValueError, match="Unknown batch operation: 'delete'"):
+        client.batch([("delete", {"job_id": "abc"})])
+
+    assert not respx.calls
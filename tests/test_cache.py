@@ -0,0 +1,106 @@
+import httpx
+import pytest
+import respx
+
+from simplecrawl import AsyncFirecrawlClient, CrawlState, FirecrawlClient
+from simplecrawl import _cache
+from simplecrawl._cache import TTLCache
+
+BASE = "http://fc.test/v1"
+JOB = {"success": True, "id": "abc", "url": "https://a.test/"}
+
+
+def status(state: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "status": state,
+            "total": 1,
+            "completed": 0,
+            "expiresAt": "2024-11-14T00:00:00",
+            "data": [],
+        },
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=4, ttl=5.0)
+    cache.set("a", 1)
+
+    clock[0] += 4.9
+    assert cache.get("a") == 1
+    clock[0] += 0.1
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_disabled_by_zero_ttl():
+    cache = TTLCache(maxsize=4, ttl=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+@respx.mock
+def test_crawl_status_is_cached_until_cancel():
+    route = respx.get(f"{BASE}/crawl/abc").mock(return_value=status("scraping"))
+    respx.delete(f"{BASE}/crawl/abc").mock(
+        return_value=httpx.Response(200, json={"success": True})
+    )
+    client = FirecrawlClient(BASE, status_cache_ttl=60.0)
+
+    assert client.get_crawl_status("abc") is client.get_crawl_status("abc")
+    assert route.call_count == 1
+
+    assert client.cancel_crawl("abc") is True
+    client.get_crawl_status("abc")
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_crawl_and_wait_bypasses_status_cache():
+    respx.post(f"{BASE}/crawl").mock(return_value=httpx.Response(200, json=JOB))
+    respx.get(f"{BASE}/crawl/abc").mock(
+        side_effect=[status("scraping"), status("scraping"), status("completed")]
+    )
+    client = FirecrawlClient(BASE, status_cache_ttl=60.0)
+    client.get_crawl_status("abc")
+
+    result = client.crawl_and_wait("https://a.test/", poll_interval=0, max_wait=5)
+
+    assert result.status == CrawlState.COMPLETED
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_crawl_and_wait_bypasses_status_cache():
+    respx.post(f"{BASE}/crawl").mock(return_value=httpx.Response(200, json=JOB))
+    respx.get(f"{BASE}/crawl/abc").mock(
+        side_effect=[status("scraping"), status("scraping"), status("completed")]
+    )
+
+    async with AsyncFirecrawlClient(BASE, status_cache_ttl=60.0) as client:
+        await client.get_crawl_status("abc")
+        result = await client.crawl_and_wait(
+            "https://a.test/", poll_interval=0, max_wait=5
+        )
+
+    assert result.status == CrawlState.COMPLETED
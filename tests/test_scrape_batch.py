@@ -0,0 +1,114 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from simplecrawl import AsyncFirecrawlClient, FirecrawlClient
+
+BASE = "http://fc.test/v1"
+PAGE = {
+    "markdown": "# hi",
+    "metadata": {"sourceURL": "https://a.test/", "statusCode": 200},
+}
+
+
+def batch_unsupported(request: httpx.Request) -> httpx.Response:
+    """A server that rejects a "urls" list but scrapes single URLs."""
+    if "urls" in json.loads(request.content):
+        return httpx.Response(400)
+    return httpx.Response(200, json={"success": True, "data": PAGE})
+
+
+def sent_urls_lists(route: respx.Route) -> int:
+    return sum("urls" in json.loads(call.request.content) for call in route.calls)
+
+
+@respx.mock
+def test_batch_supported():
+    route = respx.post(f"{BASE}/scrape").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": [PAGE, PAGE]})
+    )
+    client = FirecrawlClient(BASE)
+
+    results = client.scrape_batch(["https://a.test/", "https://b.test/"])
+
+    assert [r.markdown for r in results] == ["# hi", "# hi"]
+    assert client._batch_scrape_supported is True
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_batch_unsupported_falls_back_and_latches():
+    route = respx.post(f"{BASE}/scrape").mock(side_effect=batch_unsupported)
+    client = FirecrawlClient(BASE)
+    urls = ["https://a.test/", "https://b.test/", "https://c.test/"]
+
+    assert len(client.scrape_batch(urls)) == 3
+    assert client._batch_scrape_supported is False
+    assert route.call_count == 4
+
+    assert len(client.scrape_batch(urls)) == 3
+    assert sent_urls_lists(route) == 1
+
+
+@respx.mock
+def test_batch_bad_options_raise_without_latching():
+    route = respx.post(f"{BASE}/scrape").mock(return_value=httpx.Response(400))
+    client = FirecrawlClient(BASE)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.scrape_batch(["https://a.test/", "https://b.test/"], formats=["bogus"])
+
+    assert client._batch_scrape_supported is None
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_batch_other_errors_raise_without_fallback():
+    route = respx.post(f"{BASE}/scrape").mock(return_value=httpx.Response(401))
+    client = FirecrawlClient(BASE)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.scrape_batch(["https://a.test/", "https://b.test/"])
+
+    assert client._batch_scrape_supported is None
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_batch_result_count_mismatch_raises():
+    respx.post(f"{BASE}/scrape").mock(
+        return_value=httpx.Response(200, json={"success": True, "data": [PAGE]})
+    )
+    client = FirecrawlClient(BASE)
+
+    with pytest.raises(ValueError, match="1 results for 2 URLs"):
+        client.scrape_batch(["https://a.test/", "https://b.test/"])
+
+    assert client._batch_scrape_supported is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_batch_unsupported_falls_back_and_latches():
+    route = respx.post(f"{BASE}/scrape").mock(side_effect=batch_unsupported)
+    urls = ["https://a.test/", "https://b.test/"]
+
+    async with AsyncFirecrawlClient(BASE) as client:
+        assert len(await client.scrape_batch(urls)) == 2
+        assert len(await client.scrape_batch(urls)) == 2
+        assert client._batch_scrape_supported is False
+
+    assert sent_urls_lists(route) == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_batch_bad_options_raise_without_latching():
+    respx.post(f"{BASE}/scrape").mock(return_value=httpx.Response(422))
+
+    async with AsyncFirecrawlClient(BASE) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.scrape_batch(["https://a.test/", "https://b.test/"])
+        assert client._batch_scrape_supported is None
@@ -0,0 +1,70 @@
+import json
+
+import httpx
+import ijson  # type: ignore[import-untyped]
+import pytest
+import respx
+
+from simplecrawl import FirecrawlClient
+from simplecrawl._stream import CrawlResultStream
+
+BASE = "http://fc.test/v1"
+PAGES = [
+    {
+        "markdown": f"# {i}",
+        "metadata": {"sourceURL": f"https://a.test/{i}", "statusCode": 200},
+    }
+    for i in range(3)
+]
+BODY = json.dumps(
+    {
+        "status": "completed",
+        "total": 3,
+        "completed": 3,
+        "expiresAt": "2024-11-14T00:00:00",
+        "data": PAGES,
+    }
+).encode()
+
+
+def chunks(body: bytes, size: int):
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, len(BODY)])
+def test_stream_parses_split_body(size):
+    stream = CrawlResultStream()
+
+    results = [result for chunk in chunks(BODY, size) for result in stream.feed(chunk)]
+    stream.close()
+
+    assert [r.markdown for r in results] == ["# 0", "# 1", "# 2"]
+
+
+def test_stream_yields_results_before_body_ends():
+    stream = CrawlResultStream()
+    end_of_first = BODY.index(b"}}") + 2
+
+    assert [r.markdown for r in stream.feed(BODY[: end_of_first + 1])] == ["# 0"]
+
+
+def test_stream_close_raises_on_truncated_body():
+    stream = CrawlResultStream()
+    stream.feed(BODY[:-10])
+
+    with pytest.raises(ijson.IncompleteJSONError):
+        stream.close()
+
+
+@respx.mock
+def test_iter_crawl_results_streams_chunked_response():
+    respx.get(f"{BASE}/crawl/abc").mock(
+        return_value=httpx.Response(200, content=iter(chunks(BODY, 16)))
+    )
+    client = FirecrawlClient(BASE)
+
+    results = list(client.iter_crawl_results("abc"))
+
+    assert [r.metadata.sourceURL for r in results] == [
+        page["metadata"]["sourceURL"] for page in PAGES
+    ]